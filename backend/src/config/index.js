@@ -6,6 +6,10 @@ const config = {
   env: process.env.NODE_ENV || 'development',
   port: parseInt(process.env.PORT, 10) || 3000,
   
+  // Keep idle connections open longer than the hosting proxy (Render/ALB ~60s)
+  // so it can reuse one upstream connection instead of reconnecting per request
+  keepAliveTimeoutMs: parseInt(process.env.KEEP_ALIVE_TIMEOUT_MS, 10) || 65000,
+  
   // API Keys
   geminiApiKey: process.env.GEMINI_API_KEY,
   
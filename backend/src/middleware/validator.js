@@ -42,6 +42,7 @@ const sanitizeQuery = (query) => {
  * Validation schemas
  */
 const schemas = {
+  // Prior turns come from the server-side session store, so clients never send history
   query: Joi.object({
     query: Joi.string().required().min(1).max(500).trim().custom((value, helpers) => {
       try {
@@ -51,7 +52,8 @@ const schemas = {
       }
     }),
     sessionId: Joi.string().optional().min(1).max(100),
-    useQueryExpansion: Joi.boolean().optional().default(false)
+    useQueryExpansion: Joi.boolean().optional().default(false),
+    expansionCount: Joi.number().integer().min(1).max(3).optional().default(3)
   }),
   
   sessionId: Joi.object({
@@ -20,17 +20,79 @@ const FEEDBACK_FILE = path.join(__dirname, '../../data/feedback.json');
 // Initialize RAG service
 await ragService.initialize();
 
+/**
+ * Write a single Server-Sent Events frame
+ */
+const sendEvent = (res, payload) => {
+  res.write(`data: ${JSON.stringify(payload)}\n\n`);
+  
+  // Push the frame through the compression middleware immediately
+  if (res.flush) {
+    res.flush();
+  }
+};
+
 /**
  * POST /api/chat/query
  * Process a user query
+ * Streams the answer as Server-Sent Events when the client sends
+ * "Accept: text/event-stream", otherwise returns a single JSON response
  */
 router.post('/query', validate('query'), asyncHandler(async (req, res) => {
-  const { query, sessionId, useQueryExpansion } = req.body;
+  const { query, sessionId, useQueryExpansion, expansionCount } = req.body;
   
   // Generate session ID if not provided
   const currentSessionId = sessionId || nanoid();
   
-  const result = await ragService.query(query, currentSessionId, useQueryExpansion);
+  if (req.accepts(['application/json', 'text/event-stream']) === 'text/event-stream') {
+    res.set({
+      'Content-Type': 'text/event-stream',
+      'Cache-Control': 'no-cache, no-transform',
+      'Connection': 'keep-alive',
+      'X-Accel-Buffering': 'no'
+    });
+    res.flushHeaders();
+    
+    // Once the client disconnects (tab closed, session rotated), stop forwarding
+    // frames and skip the history write; Gemini itself cannot be cancelled
+    const abortController = new AbortController();
+    res.on('close', () => {
+      if (!res.writableEnded) {
+        abortController.abort();
+      }
+    });
+    const { signal } = abortController;
+    
+    // Headers are already sent, so errors are reported as a terminal frame
+    try {
+      const result = await ragService.query(
+        query,
+        currentSessionId,
+        useQueryExpansion,
+        expansionCount,
+        (text) => {
+          if (!signal.aborted) {
+            sendEvent(res, { type: 'delta', text });
+          }
+        },
+        signal
+      );
+      
+      if (!signal.aborted) {
+        sendEvent(res, { type: 'done', data: result });
+      }
+    } catch (error) {
+      logger.error(`Streaming query failed: ${error.message}`);
+      if (!signal.aborted) {
+        sendEvent(res, { type: 'error', error: { message: error.message } });
+      }
+    }
+    
+    res.end();
+    return;
+  }
+  
+  const result = await ragService.query(query, currentSessionId, useQueryExpansion, expansionCount);
   
   res.json({
     success: true,
@@ -111,7 +173,7 @@ router.post('/feedback', validate('feedback'), asyncHandler(async (req, res) =>
     feedbackData.push(feedbackEntry);
     
     // Write back to file
-    await fs.writeFile(FEEDBACK_FILE, JSON.stringify(feedbackData, null, 2));
+    await fs.writeFile(FEEDBACK_FILE, JSON.stringify(feedbackData));
     
     logger.info(`Feedback received: ${rating} for query "${query.substring(0, 50)}..."`);
     
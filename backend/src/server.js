@@ -124,6 +124,10 @@ if (config.env !== 'test') {
       logger.info(`API available at http://localhost:${PORT}`);
     });
     
+    // headersTimeout must exceed keepAliveTimeout or Node may drop reused sockets
+    server.keepAliveTimeout = config.keepAliveTimeoutMs;
+    server.headersTimeout = config.keepAliveTimeoutMs + 1000;
+    
     server.on('error', (error) => {
       logger.error('Server error:', error);
       process.exit(1);
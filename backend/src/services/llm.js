@@ -86,57 +86,110 @@ TRANSPARENCY:
 Remember: Accuracy over completeness. It's better to say "I don't know" than to make up information.`;
   }
 
+  /**
+   * Build the full prompt from system instructions, history and context
+   */
+  buildPrompt(query, context, conversationHistory = []) {
+    const systemPrompt = this.createSystemPrompt();
+    
+    // Add conversation history if available
+    if (conversationHistory.length > 0) {
+      const historyText = conversationHistory
+        .slice(-3) // Last 3 exchanges
+        .map(msg => `${msg.role === 'user' ? 'User' : 'Assistant'}: ${msg.content}`)
+        .join('\n');
+      
+      return `${systemPrompt}\n\nPrevious conversation:\n${historyText}\n\n${context}\n\nUser Question: ${query}\n\nAssistant:`;
+    }
+    
+    return `${systemPrompt}\n\n${context}\n\nUser Question: ${query}\n\nAssistant:`;
+  }
+
+  /**
+   * Package generated text with sources, confidence and metadata
+   */
+  buildResult(text, retrievedChunks, context) {
+    // Extract sources from retrieved chunks
+    const sources = retrievedChunks.map((chunk, index) => ({
+      id: index + 1,
+      title: chunk.metadata.title,
+      url: chunk.metadata.source,
+      relevanceScore: chunk.score ? chunk.score.toFixed(3) : null
+    }));
+    
+    // Check for hallucination indicators
+    const confidence = this.assessConfidence(text, context);
+    
+    return {
+      answer: text,
+      sources,
+      confidence,
+      metadata: {
+        model: config.llm.model,
+        chunksRetrieved: retrievedChunks.length,
+        timestamp: new Date().toISOString()
+      }
+    };
+  }
+
   /**
    * Generate response with RAG
    */
   async generateResponse(query, retrievedChunks, conversationHistory = []) {
     try {
-      const systemPrompt = this.createSystemPrompt();
       const context = this.buildContext(retrievedChunks);
-      
-      // Build the full prompt
-      let fullPrompt = `${systemPrompt}\n\n${context}\n\nUser Question: ${query}\n\nAssistant:`;
-      
-      // Add conversation history if available
-      if (conversationHistory.length > 0) {
-        const historyText = conversationHistory
-          .slice(-3) // Last 3 exchanges
-          .map(msg => `${msg.role === 'user' ? 'User' : 'Assistant'}: ${msg.content}`)
-          .join('\n');
-        
-        fullPrompt = `${systemPrompt}\n\nPrevious conversation:\n${historyText}\n\n${context}\n\nUser Question: ${query}\n\nAssistant:`;
-      }
+      const fullPrompt = this.buildPrompt(query, context, conversationHistory);
       
       logger.info(`Generating response for query: "${query}"`);
       
       // Generate response
       const result = await this.model.generateContent(fullPrompt);
-      const response = result.response;
-      const text = response.text();
+      const text = result.response.text();
       
-      // Extract sources from retrieved chunks
-      const sources = retrievedChunks.map((chunk, index) => ({
-        id: index + 1,
-        title: chunk.metadata.title,
-        url: chunk.metadata.source,
-        relevanceScore: chunk.score ? chunk.score.toFixed(3) : null
-      }));
+      return this.buildResult(text, retrievedChunks, context);
+    } catch (error) {
+      logger.error(`Error generating response: ${error.message}`);
+      throw new Error('Failed to generate response. Please try again.');
+    }
+  }
+
+  /**
+   * Generate response with RAG, passing text deltas to onDelta as they arrive
+   * Once the optional AbortSignal fires, no further deltas are forwarded. The SDK
+   * (0.2.x) cannot cancel the upstream request, so Gemini still finishes generating.
+   */
+  async generateResponseStream(query, retrievedChunks, conversationHistory = [], onDelta = () => {}, signal = null) {
+    try {
+      const context = this.buildContext(retrievedChunks);
+      const fullPrompt = this.buildPrompt(query, context, conversationHistory);
+      
+      logger.info(`Streaming response for query: "${query}"`);
+      
+      const result = await this.model.generateContentStream(fullPrompt);
       
-      // Check for hallucination indicators
-      const confidence = this.assessConfidence(text, context);
+      // The SDK tees one HTTP stream into result.stream and result.response. Stream
+      // errors surface through the loop below, so swallow the duplicate rejection on
+      // the unused response promise instead of crashing the process with it.
+      result.response.catch(() => {});
       
-      return {
-        answer: text,
-        sources,
-        confidence,
-        metadata: {
-          model: config.llm.model,
-          chunksRetrieved: retrievedChunks.length,
-          timestamp: new Date().toISOString()
+      let text = '';
+      
+      for await (const chunk of result.stream) {
+        if (signal?.aborted) {
+          logger.info('Client disconnected, stopped forwarding response');
+          break;
         }
-      };
+        
+        const delta = chunk.text();
+        if (delta) {
+          text += delta;
+          onDelta(delta);
+        }
+      }
+      
+      return this.buildResult(text, retrievedChunks, context);
     } catch (error) {
-      logger.error(`Error generating response: ${error.message}`);
+      logger.error(`Error streaming response: ${error.message}`);
       throw new Error('Failed to generate response. Please try again.');
     }
   }
@@ -229,7 +282,7 @@ Remember: Accuracy over completeness. It's better to say "I don't know" than to
    * Rewrite user query to better search query for retrieval
    * Understands intent and extracts key concepts without hallucination
    */
-  async rewriteQuery(userQuery) {
+  async rewriteQuery(userQuery, maxQueries = 3) {
     try {
       const prompt = `You are a search query optimizer for GitLab's Handbook and Direction documentation.
 
@@ -237,7 +290,7 @@ USER QUERY: "${userQuery}"
 
 YOUR TASK:
 1. Identify the core intent and key concepts (fix any obvious typos/misspellings)
-2. Generate 1-3 optimized search queries that would find relevant GitLab documentation
+2. Generate 1-${maxQueries} optimized search queries that would find relevant GitLab documentation
 3. ONLY use concepts that appear in the original query - do NOT add external knowledge
 4. Make queries more specific and searchable
 
@@ -255,7 +308,7 @@ OPTIMIZED SEARCH QUERIES:`;
         .split('\n')
         .map(line => line.replace(/^[-•*]\s*/, '').trim()) // Remove bullets
         .filter(line => line.length > 5 && line.length < 200)
-        .slice(0, 3); // Max 3 queries
+        .slice(0, maxQueries);
       
       if (rewrittenQueries.length === 0) {
         return [userQuery];
@@ -272,8 +325,8 @@ OPTIMIZED SEARCH QUERIES:`;
   /**
    * Expand query for better retrieval (legacy method - use rewriteQuery instead)
    */
-  async expandQuery(query) {
-    return this.rewriteQuery(query);
+  async expandQuery(query, maxQueries = 3) {
+    return this.rewriteQuery(query, maxQueries);
   }
 }
 
@@ -94,8 +94,12 @@ class RAGService {
 
   /**
    * Main query processing with RAG
+   * expansionCount caps how many rewritten queries are retrieved together in one batch
+   * When onDelta is provided, answer text is streamed to it as it is generated
+   * If signal aborts (client went away), deltas stop being forwarded and null is
+   * returned without touching conversation history
    */
-  async query(userQuery, sessionId = null, useQueryExpansion = true) {
+  async query(userQuery, sessionId = null, useQueryExpansion = true, expansionCount = 3, onDelta = null, signal = null) {
     try {
       const startTime = Date.now();
       
@@ -125,16 +129,15 @@ class RAGService {
       let queries = [userQuery];
       if (useQueryExpansion) {
         // Rewrite query to understand user intent better
-        queries = await this.llmService.rewriteQuery(userQuery);
+        queries = await this.llmService.rewriteQuery(userQuery, expansionCount);
         logger.info(`Query rewritten into ${queries.length} optimized search queries`);
       }
       
-      // Retrieve context from all query variations
-      const allResults = [];
-      for (const query of queries) {
-        const results = await this.retrieveContext(query, config.rag.topK);
-        allResults.push(...results);
-      }
+      // Retrieve context for all query variations as one concurrent batch
+      const resultSets = await Promise.all(
+        queries.map(query => this.retrieveContext(query, config.rag.topK))
+      );
+      const allResults = resultSets.flat();
       
       // Deduplicate by chunk ID
       const uniqueResults = Array.from(
@@ -145,15 +148,35 @@ class RAGService {
       const rerankedResults = this.rerankResults(uniqueResults, userQuery);
       const topResults = rerankedResults.slice(0, config.rag.topK);
       
+      // Don't start generation for a client that has already gone
+      if (signal?.aborted) {
+        logger.info(`Query abandoned by client [session: ${sessionId}]`);
+        return null;
+      }
+      
       // Get conversation history
       const conversationHistory = this.getConversationHistory(sessionId);
       
       // Generate response
-      const response = await this.llmService.generateResponse(
-        userQuery,
-        topResults,
-        conversationHistory
-      );
+      const response = onDelta
+        ? await this.llmService.generateResponseStream(
+          userQuery,
+          topResults,
+          conversationHistory,
+          onDelta,
+          signal
+        )
+        : await this.llmService.generateResponse(
+          userQuery,
+          topResults,
+          conversationHistory
+        );
+      
+      // A partial answer the user never saw must not become context for later turns
+      if (signal?.aborted) {
+        logger.info(`Query abandoned by client [session: ${sessionId}]`);
+        return null;
+      }
       
       // Store in conversation history
       this.addToConversationHistory(sessionId, {
@@ -162,9 +162,11 @@ class ConversationStore {
     if (this.cache.size >= this.maxCacheSize && !this.cache.has(sessionId)) {
       const oldestKey = this.cache.keys().next().value;
       
-      // Save oldest session before evicting from memory
+      // Save oldest session before evicting from memory (empty ones aren't worth a file)
       const oldHistory = this.cache.get(oldestKey);
-      this.saveAsync(oldestKey, oldHistory);
+      if (oldHistory.length > 0) {
+        this.saveAsync(oldestKey, oldHistory);
+      }
       
       this.cache.delete(oldestKey);
       logger.debug(`Evicted session ${oldestKey} from cache (LRU)`);
@@ -223,7 +225,7 @@ class ConversationStore {
     };
     
     // Non-blocking write
-    fs.writeFile(filePath, JSON.stringify(data, null, 2), 'utf8', (error) => {
+    fs.writeFile(filePath, JSON.stringify(data), 'utf8', (error) => {
       if (error) {
         logger.error(`Failed to save conversation ${sessionId}: ${error.message}`);
       }
@@ -244,7 +246,7 @@ class ConversationStore {
           lastUpdated: new Date().toISOString()
         };
         
-        fs.writeFileSync(filePath, JSON.stringify(data, null, 2), 'utf8');
+        fs.writeFileSync(filePath, JSON.stringify(data), 'utf8');
         savedCount++;
       } catch (error) {
         logger.error(`Failed to save conversation ${sessionId}: ${error.message}`);
@@ -1,5 +1,14 @@
+import http from 'http';
+import { jest } from '@jest/globals';
 import request from 'supertest';
 import app from '../src/server.js';
+import RAGService from '../src/services/rag.js';
+
+// Split an SSE body into its JSON data frames
+const parseEvents = (text) => text
+  .split('\n\n')
+  .filter(frame => frame.startsWith('data: '))
+  .map(frame => JSON.parse(frame.slice('data: '.length)));
 
 describe('API Endpoints', () => {
   // Clean up after all tests
@@ -45,6 +54,131 @@ describe('API Endpoints', () => {
       
       expect(res.statusCode).toBe(400);
     });
+
+    it('should reject out-of-range expansion counts', async () => {
+      const res = await request(app)
+        .post('/api/chat/query')
+        .send({ query: 'What are GitLab values?', useQueryExpansion: true, expansionCount: 10 });
+      
+      expect(res.statusCode).toBe(400);
+      expect(res.body.error.details[0].field).toBe('expansionCount');
+    });
+
+    it('should return JSON validation errors to streaming clients', async () => {
+      const res = await request(app)
+        .post('/api/chat/query')
+        .set('Accept', 'text/event-stream')
+        .send({ query: '' });
+      
+      expect(res.statusCode).toBe(400);
+      expect(res.headers['content-type']).toMatch(/application\/json/);
+      expect(res.body.success).toBe(false);
+    });
+  });
+
+  describe('POST /api/chat/query (streaming)', () => {
+    afterEach(() => {
+      jest.restoreAllMocks();
+    });
+
+    it('should stream delta frames followed by one done frame', async () => {
+      jest.spyOn(RAGService.prototype, 'query').mockImplementation(
+        async (query, sessionId, useQueryExpansion, expansionCount, onDelta) => {
+          onDelta('GitLab values ');
+          onDelta('are CREDIT.');
+          return { answer: 'GitLab values are CREDIT.', sources: [], confidence: 'high' };
+        }
+      );
+      
+      const res = await request(app)
+        .post('/api/chat/query')
+        .set('Accept', 'text/event-stream')
+        .send({ query: 'What are GitLab values?' });
+      
+      expect(res.statusCode).toBe(200);
+      expect(res.headers['content-type']).toMatch(/text\/event-stream/);
+      
+      const events = parseEvents(res.text);
+      expect(events.map(event => event.type)).toEqual(['delta', 'delta', 'done']);
+      expect(events[0].text).toBe('GitLab values ');
+      expect(events[2].data.answer).toBe('GitLab values are CREDIT.');
+    });
+
+    it('should end with an error frame when the query fails', async () => {
+      jest.spyOn(RAGService.prototype, 'query').mockRejectedValue(
+        new Error('Failed to generate response. Please try again.')
+      );
+      
+      const res = await request(app)
+        .post('/api/chat/query')
+        .set('Accept', 'text/event-stream')
+        .send({ query: 'What are GitLab values?' });
+      
+      expect(res.statusCode).toBe(200);
+      
+      const events = parseEvents(res.text);
+      expect(events).toEqual([
+        { type: 'error', error: { message: 'Failed to generate response. Please try again.' } }
+      ]);
+    });
+  });
+
+  describe('POST /api/chat/query (client disconnect)', () => {
+    afterEach(() => {
+      jest.restoreAllMocks();
+    });
+
+    it('should not write a done frame after the client disconnects', async () => {
+      // compression captures res.write per request, so spying on the prototype sees every frame
+      const writeSpy = jest.spyOn(http.ServerResponse.prototype, 'write');
+      let finishQuery;
+      const queryFinished = new Promise(resolve => {
+        finishQuery = resolve;
+      });
+      
+      jest.spyOn(RAGService.prototype, 'query').mockImplementation(
+        async (query, sessionId, useQueryExpansion, expansionCount, onDelta, signal) => {
+          onDelta('GitLab values ');
+          await new Promise(resolve => signal.addEventListener('abort', resolve, { once: true }));
+          onDelta('are CREDIT.');
+          finishQuery();
+          return { answer: 'GitLab values are CREDIT.', sources: [], confidence: 'high' };
+        }
+      );
+      
+      const server = app.listen(0);
+      try {
+        const { port } = server.address();
+        
+        // Hang up as soon as the first frame arrives
+        await new Promise(resolve => {
+          const req = http.request({
+            port,
+            method: 'POST',
+            path: '/api/chat/query',
+            headers: { 'Content-Type': 'application/json', 'Accept': 'text/event-stream' }
+          }, (res) => {
+            res.on('error', () => {});
+            res.once('data', () => {
+              req.destroy();
+              resolve();
+            });
+          });
+          req.on('error', () => {});
+          req.end(JSON.stringify({ query: 'What are GitLab values?' }));
+        });
+        
+        await queryFinished;
+        await new Promise(resolve => setImmediate(resolve));
+      } finally {
+        server.close();
+      }
+      
+      const written = writeSpy.mock.calls.map(([chunk]) => String(chunk)).join('');
+      expect(written).toContain('"type":"delta"');
+      expect(written).not.toContain('are CREDIT.');
+      expect(written).not.toContain('"type":"done"');
+    });
   });
 
   describe('GET /api/chat/stats', () => {
@@ -0,0 +1,36 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import ConversationStore from '../src/utils/conversationStore.js';
+
+describe('ConversationStore', () => {
+  let store;
+  let storageDir;
+
+  beforeEach(() => {
+    store = new ConversationStore();
+    
+    // Isolate each test from real conversations on disk
+    storageDir = fs.mkdtempSync(path.join(os.tmpdir(), 'conversations-'));
+    store.storageDir = storageDir;
+    store.cache.clear();
+  });
+
+  afterEach(() => {
+    fs.rmSync(storageDir, { recursive: true, force: true });
+  });
+
+  describe('addToCache', () => {
+    it('should not write empty histories to disk on eviction', async () => {
+      store.addToCache('empty', []);
+      for (let i = 0; i < store.maxCacheSize; i++) {
+        store.addToCache(`session_${i}`, [{ role: 'user', content: `Question ${i}` }]);
+      }
+      
+      expect(store.cache.has('empty')).toBe(false);
+      
+      await new Promise(resolve => setTimeout(resolve, 50));
+      expect(fs.readdirSync(storageDir)).toEqual([]);
+    });
+  });
+});
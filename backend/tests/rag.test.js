@@ -0,0 +1,51 @@
+import { jest } from '@jest/globals';
+import RAGService from '../src/services/rag.js';
+
+describe('RAGService', () => {
+  let ragService;
+
+  beforeEach(() => {
+    ragService = new RAGService();
+    jest.spyOn(ragService, 'retrieveContext').mockResolvedValue([]);
+    jest.spyOn(ragService, 'addToConversationHistory').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  describe('query with an abort signal', () => {
+    it('should skip generation and history when already aborted', async () => {
+      const abortController = new AbortController();
+      abortController.abort();
+      const generate = jest.spyOn(ragService.llmService, 'generateResponseStream');
+      
+      const result = await ragService.query(
+        'What are GitLab values?', 'session_test', false, 3, () => {}, abortController.signal
+      );
+      
+      expect(result).toBeNull();
+      expect(generate).not.toHaveBeenCalled();
+      expect(ragService.addToConversationHistory).not.toHaveBeenCalled();
+    });
+
+    it('should skip the history write when aborted during generation', async () => {
+      const abortController = new AbortController();
+      jest.spyOn(ragService.llmService, 'generateResponseStream').mockImplementation(
+        async (query, retrievedChunks, conversationHistory, onDelta) => {
+          onDelta('GitLab values ');
+          abortController.abort();
+          return { answer: 'GitLab values ', sources: [], confidence: 'low', metadata: {} };
+        }
+      );
+      
+      const result = await ragService.query(
+        'What are GitLab values?', 'session_test', false, 3, () => {}, abortController.signal
+      );
+      
+      expect(result).toBeNull();
+      expect(ragService.llmService.generateResponseStream).toHaveBeenCalledTimes(1);
+      expect(ragService.addToConversationHistory).not.toHaveBeenCalled();
+    });
+  });
+});